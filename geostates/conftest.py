@@ -0,0 +1,21 @@
+from collections import OrderedDict
+
+import pytest
+
+from geostates.shapefiles import registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(tmp_path, monkeypatch):
+    datasets = dict(registry._datasets)
+    loaded = OrderedDict(registry._loaded)
+    memory_limit = registry._memory_limit
+    monkeypatch.setattr(registry, 'CACHE_DIR', str(tmp_path / 'cache'))
+    registry.clear_cache()
+    yield
+    with registry._lock:
+        registry._datasets.clear()
+        registry._datasets.update(datasets)
+        registry._loaded.clear()
+        registry._loaded.update(loaded)
+        registry._memory_limit = memory_limit
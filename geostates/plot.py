@@ -4,16 +4,30 @@ import numpy as np
 import geopandas as gpd
 import pandas as pd
 import math
+import shapely
 
 from .utils import discrete_cmap
+from .shapefiles.registry import load_dataset, reproject, crs_key, get_transformer
 
 from matplotlib.lines import Line2D
 from matplotlib.colors import ListedColormap, LinearSegmentedColormap
 from matplotlib.cm import ScalarMappable
 
+# the CRS of the Census boundary files, which the inset limits and label positions below are given in
+GEOGRAPHIC_CRS = 'EPSG:4269'
+
+# equal-area projections for the continental United States and each inset plot
+ALBERS_PROJECTIONS = {
+    'conus': 'EPSG:5070',
+    'AK': 'EPSG:3338',
+    'HI': '+proj=aea +lat_0=13 +lon_0=-157 +lat_1=8 +lat_2=18 +x_0=0 +y_0=0 +datum=NAD83 +units=m +no_defs',
+    'PR': '+proj=aea +lat_0=18.2 +lon_0=-66.4 +lat_1=17.9 +lat_2=18.5 +x_0=0 +y_0=0 +datum=NAD83 +units=m +no_defs',
+    'GU': '+proj=aea +lat_0=13.45 +lon_0=144.8 +lat_1=13.25 +lat_2=13.65 +x_0=0 +y_0=0 +datum=NAD83 +units=m +no_defs',
+}
+
 
 def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle='solid', cmap='copper_r',
-                legend=None, bins=10):
+                legend=None, bins=10, projection=None):
     """Plot a choropleth map of the United States.
 
     Parameters
@@ -54,6 +68,16 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
        Specifies how many bins to group values into for a legend or
        discrete colorbar.
 
+    projection : str, default=None
+       Map projection to draw the regions in. None plots longitude and
+       latitude directly. 'albers' uses equal-area Albers projections,
+       one for the continental United States and one for each inset
+       plot. Reprojected boundaries are cached per dataset and
+       projection, so only the first plot in a projection pays for the
+       reprojection. The DataFrame may be in any CRS but must have one
+       for 'albers'; without a CRS it is taken to be in longitude and
+       latitude.
+
     Returns
     -------
     A choropleth plot of the United States.
@@ -71,17 +95,128 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
     alaska_ax = continental_states_ax.inset_axes([.08, .012, .20, .28])
     hawaii_ax = continental_states_ax.inset_axes([.28, .014, .15, .19])
 
+    # ------------------------------------------SET THE PROJECTION--------------------------------------
+
+    if projection is None:
+        projections = {}
+    elif projection == 'albers':
+        projections = ALBERS_PROJECTIONS
+    else:
+        raise ValueError('Projection must be None or \'albers\'')
+
+    if df.crs is None and projections:
+        raise ValueError('The DataFrame has no CRS, so it cannot be projected; set one with df.set_crs()')
+
+    # the CRS the inset limits and label positions are given in; without a projection, a DataFrame in
+    # longitude and latitude (or without a CRS) is plotted as it is, like the Census boundary files
+    if not projections and (df.crs is None or df.crs.is_geographic):
+        geographic_crs = crs_key(df.crs) if df.crs is not None else crs_key(GEOGRAPHIC_CRS)
+    else:
+        geographic_crs = crs_key(GEOGRAPHIC_CRS)
+
+    def inset_crs(region):
+
+        '''Returns the CRS an inset is drawn in (longitude and latitude unless a projection is given).
+        Parameters
+        ----------
+        region : the key of the inset in the projections
+
+        '''
+
+        if region in projections:
+            return crs_key(projections[region])
+        return geographic_crs
+
+    # map each axis to the CRS it is drawn in
+    axis_crs = {continental_states_ax: inset_crs('conus'),
+                alaska_ax: inset_crs('AK'),
+                hawaii_ax: inset_crs('HI')}
+
+    # copies of the DataFrame, one per CRS; a DataFrame without a CRS is taken to be in longitude and latitude
+    projected_dfs = {crs_key(df.crs) if df.crs is not None else geographic_crs: df}
+
+    def crs_df(crs):
+
+        '''Returns the DataFrame reprojected to a CRS.
+        Parameters
+        ----------
+        crs : the CRS, as returned by crs_key
+
+        '''
+
+        if crs not in projected_dfs:
+            projected_dfs[crs] = _project(df, crs)
+        return projected_dfs[crs]
+
+    def region_df(axis):
+
+        '''Returns the DataFrame reprojected to the CRS of an axis.
+        Parameters
+        ----------
+        axis : the axis the regions are plotted on
+
+        '''
+
+        return crs_df(axis_crs[axis])
+
+    def to_map(axis, x, y):
+
+        '''Converts a longitude and latitude to the coordinates of an axis.
+        Parameters
+        ----------
+        axis : the axis the point is placed on
+        x, y : the longitude and latitude of the point
+
+        '''
+
+        if axis_crs[axis] == geographic_crs:
+            return x, y
+        return get_transformer(geographic_crs, axis_crs[axis]).transform(x, y)
+
+    def set_extent(axis, xlim, ylim):
+
+        '''Sets the x and y limits of an axis from a longitude and latitude box.
+        Parameters
+        ----------
+        axis : the axis to set the limits of
+        xlim, ylim : the longitude and latitude limits
+
+        '''
+
+        if axis_crs[axis] == geographic_crs:
+            axis.set_xlim(*xlim)
+            axis.set_ylim(*ylim)
+        else:
+            xmin, ymin, xmax, ymax = get_transformer(geographic_crs, axis_crs[axis]).transform_bounds(
+                xlim[0], ylim[0], xlim[1], ylim[1], densify_pts=21)
+            axis.set_xlim(xmin, xmax)
+            axis.set_ylim(ymin, ymax)
+
+    def annotate(axis, text, xy, xytext=None, **kwargs):
+
+        '''Annotates an axis at a longitude and latitude.
+        Parameters
+        ----------
+        axis : the axis to annotate
+        text : the text of the annotation
+        xy, xytext : the longitude and latitude of the point and of the text
+
+        '''
+
+        if xytext is not None:
+            kwargs['xytext'] = to_map(axis, *xytext)
+        return axis.annotate(text, xy=to_map(axis, *xy), **kwargs)
+
+    # ---------------------------------------------------------------------------------------------------
+
     # set the x and y limits for the continental United States plot
-    continental_states_ax.set_xlim(-130, -64)
-    continental_states_ax.set_ylim(22, 53)
+    set_extent(continental_states_ax, (-130, -64), (22, 53))
 
     # set the x and y limits for the Alaska plot
-    alaska_ax.set_xlim(-180, -127)
-    alaska_ax.set_ylim(51, 72)
+    set_extent(alaska_ax, (-180, -127), (51, 72))
 
     # set the x and y limits for the Hawaii plot
-    hawaii_ax.set_xlim(-160, -154.6)
-    hawaii_ax.set_ylim(18.8, 22.5)
+    set_extent(hawaii_ax, (-160, -154.6), (18.8, 22.5))
 
     # ----------------------------------------BEGIN SET PARAMETER VALUES--------------------------------
 
@@ -92,16 +227,17 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
         puerto_rico_ax = continental_states_ax.inset_axes([.512, .03, .11, .11])
         guam_ax = continental_states_ax.inset_axes([.612, .03, .10, .15])
 
+        axis_crs[puerto_rico_ax] = inset_crs('PR')
+        axis_crs[guam_ax] = inset_crs('GU')
+
         # set the x and y limits for the Puerto Rico plot
-        puerto_rico_ax.set_xlim(-67.4, -65.1)
-        puerto_rico_ax.set_ylim(17.55, 18.9)
+        set_extent(puerto_rico_ax, (-67.4, -65.1), (17.55, 18.9))
 
         # set the x and y limits for the Guam plot
-        guam_ax.set_xlim(144.55, 145)
-        guam_ax.set_ylim(13.2, 13.7)
+        set_extent(guam_ax, (144.55, 145), (13.2, 13.7))
 
-        df.loc[['PR']].plot(ax=puerto_rico_ax, cmap=cmap)
-        df.loc[['GU']].plot(ax=guam_ax, cmap=cmap)
+        region_df(puerto_rico_ax).loc[['PR']].plot(ax=puerto_rico_ax, cmap=cmap)
+        region_df(guam_ax).loc[['GU']].plot(ax=guam_ax, cmap=cmap)
 
         # set axis array
         axis_list_full = [alaska_ax, hawaii_ax, puerto_rico_ax, guam_ax, continental_states_ax]
@@ -170,7 +306,7 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
 
         '''
 
-        state = df.loc[state_name]
+        state = crs_df(geographic_crs).loc[state_name]
         centroid_x = round(state['geometry'].centroid.x, 4)
         return centroid_x
 
@@ -184,7 +320,7 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
 
         '''
 
-        state = df.loc[state_name]
+        state = crs_df(geographic_crs).loc[state_name]
         centroid_y = round(state['geometry'].centroid.y, 4)
         return centroid_y
 
@@ -232,73 +368,73 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
         for row in rows:
             test = df.loc[row]
 
-            continental_states_ax.annotate(test.name, xy=(centroid_x(row), centroid_y(row)), color='white',
-                                           ha='center', va='center')
+            annotate(continental_states_ax, test.name, xy=(centroid_x(row), centroid_y(row)), color='white',
+                     ha='center', va='center')
 
         # custom state labels for states in which using polygon centroids does not provide a good center for labels
 
         # state label annotation for Florida
-        continental_states_ax.annotate('FL', xy=(centroid_x('FL') + .75, centroid_y('FL')), color='white',
-                                       ha='center', va='center')
+        annotate(continental_states_ax, 'FL', xy=(centroid_x('FL') + .75, centroid_y('FL')), color='white',
+                 ha='center', va='center')
 
         # state label annotation for Michigan
-        continental_states_ax.annotate('MI', xy=(centroid_x('MI') + .58, centroid_y('MI') - .85), color='white',
-                                       ha='center', va='center')
+        annotate(continental_states_ax, 'MI', xy=(centroid_x('MI') + .58, centroid_y('MI') - .85), color='white',
+                 ha='center', va='center')
 
         # state label annotation for Louisiana
-        continental_states_ax.annotate('LA', xy=(centroid_x('LA') - .5, centroid_y('LA')), color='white',
-                                       ha='center', va='center')
+        annotate(continental_states_ax, 'LA', xy=(centroid_x('LA') - .5, centroid_y('LA')), color='white',
+                 ha='center', va='center')
 
         # state label annotation for California
-        continental_states_ax.annotate('CA', xy=(centroid_x('CA') - .4, centroid_y('CA')), color='white',
-                                       ha='center', va='center')
+        annotate(continental_states_ax, 'CA', xy=(centroid_x('CA') - .4, centroid_y('CA')), color='white',
+                 ha='center', va='center')
 
         # state label annotation for Massachusetts
-        continental_states_ax.annotate('MA', xy=(centroid_x('MA'), centroid_y('MA') + .075), color='white',
-                                       ha='center', va='center')
+        annotate(continental_states_ax, 'MA', xy=(centroid_x('MA'), centroid_y('MA') + .075), color='white',
+                 ha='center', va='center')
 
         # state labels for inset plots
 
         # state label annotation for Alaska inset plots
-        alaska_ax.annotate('AK', xy=(centroid_x('AK'), centroid_y('AK')), color='white', ha='center', va='center')
+        annotate(alaska_ax, 'AK', xy=(centroid_x('AK'), centroid_y('AK')), color='white', ha='center', va='center')
 
         # state label annotation for Hawaii inset plot
-        hawaii_ax.annotate('HI', xy=(-155.52, 19.61), color='white', ha='center', va='center')
+        annotate(hawaii_ax, 'HI', xy=(-155.52, 19.61), color='white', ha='center', va='center')
 
         # state labels for New England states
 
         # create the label for Rhode Island
-        continental_states_ax.annotate('RI', ha='center', xy=(centroid_x('RI'), centroid_y('RI')), xycoords='data',
-                                       xytext=(-70, 40.5), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-25, armB=0, rad=0"))
+        annotate(continental_states_ax, 'RI', ha='center', xy=(centroid_x('RI'), centroid_y('RI')), xycoords='data',
+                 xytext=(-70, 40.5), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-25, armB=0, rad=0"))
 
         # create the label for New Jersey
-        continental_states_ax.annotate('NJ', ha='center', xy=(centroid_x('NJ'), centroid_y('NJ')), xycoords='data',
-                                       xytext=(-72.75, 39.4), textcoords='data', arrowprops=dict(arrowstyle='-'))
+        annotate(continental_states_ax, 'NJ', ha='center', xy=(centroid_x('NJ'), centroid_y('NJ')), xycoords='data',
+                 xytext=(-72.75, 39.4), textcoords='data', arrowprops=dict(arrowstyle='-'))
 
         # create the label for Delaware
-        continental_states_ax.annotate('DE', ha='center', xy=(centroid_x('DE'), centroid_y('DE')), xycoords='data',
-                                       xytext=(-73.50, 38.25), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=0, armB=0, rad=0"))
+        annotate(continental_states_ax, 'DE', ha='center', xy=(centroid_x('DE'), centroid_y('DE')), xycoords='data',
+                 xytext=(-73.50, 38.25), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=0, armB=0, rad=0"))
 
         # create the label for DC
-        continental_states_ax.annotate('DC', ha='center', xy=(centroid_x('DC'), centroid_y('DC')), xycoords='data',
-                                       xytext=(-74.2, 36.5), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
+        annotate(continental_states_ax, 'DC', ha='center', xy=(centroid_x('DC'), centroid_y('DC')), xycoords='data',
+                 xytext=(-74.2, 36.5), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
 
         # create the label for Maryland
-        continental_states_ax.annotate('MD', xy=(centroid_x('MD'), centroid_y('MD')), xycoords='data',
-                                       xytext=(-74.4, 37.35), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
+        annotate(continental_states_ax, 'MD', xy=(centroid_x('MD'), centroid_y('MD')), xycoords='data',
+                 xytext=(-74.4, 37.35), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
 
         # state labels for extra region inset plots
         if extra_regions == True:
             # state label annotation for Puerto Rico inset plot
-            puerto_rico_ax.annotate('PR', xy=(centroid_x('PR'), centroid_y('PR')), color='white', ha='center',
-                                    va='center')
+            annotate(puerto_rico_ax, 'PR', xy=(centroid_x('PR'), centroid_y('PR')), color='white', ha='center',
+                     va='center')
 
             # state label annotation for Guam inset plot
-            guam_ax.annotate('GU', xy=(144.715, 13.355), color='white', ha='center', va='center')
+            annotate(guam_ax, 'GU', xy=(144.715, 13.355), color='white', ha='center', va='center')
 
 
 
@@ -310,97 +446,97 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
         for row in rows:
             test = df.loc[row]
 
-            continental_states_ax.annotate(test.name + '\n' + get_value(test, column), xy=(centroid_x(row),
-                                                                                           centroid_y(row)),
-                                           color='white', ha='center', va='center')
+            annotate(continental_states_ax, test.name + '\n' + get_value(test, column), xy=(centroid_x(row),
+                                                                                            centroid_y(row)),
+                     color='white', ha='center', va='center')
 
         # custom state labels for states in which using polygon centroids does not provide a good center for labels
 
         # state label annotation for Florida
-        continental_states_ax.annotate('FL' + '\n' + get_value(state_df('FL'), column), xy=(centroid_x('FL') + .75,
-                                                                                            centroid_y('FL')),
-                                       color='white', ha='center', va='center')
+        annotate(continental_states_ax, 'FL' + '\n' + get_value(state_df('FL'), column), xy=(centroid_x('FL') + .75,
+                                                                                             centroid_y('FL')),
+                 color='white', ha='center', va='center')
 
         # state label annotation for Michigan
-        continental_states_ax.annotate('MI' + '\n' + get_value(state_df('MI'), column), xy=(centroid_x('MI') + .58,
-                                                                                            centroid_y('MI') - .85),
-                                       color='white', ha='center', va='center')
+        annotate(continental_states_ax, 'MI' + '\n' + get_value(state_df('MI'), column), xy=(centroid_x('MI') + .58,
+                                                                                             centroid_y('MI') - .85),
+                 color='white', ha='center', va='center')
 
         # state label annotation for Louisiana
-        continental_states_ax.annotate('LA' + '\n' + get_value(state_df('LA'), column), xy=(centroid_x('LA') - .5,
-                                                                                            centroid_y('LA')),
-                                       color='white', ha='center', va='center')
+        annotate(continental_states_ax, 'LA' + '\n' + get_value(state_df('LA'), column), xy=(centroid_x('LA') - .5,
+                                                                                             centroid_y('LA')),
+                 color='white', ha='center', va='center')
 
         # state label annotation for California
-        continental_states_ax.annotate('CA' + '\n' + get_value(state_df('CA'), column), xy=(centroid_x('CA') - .4,
-                                                                                            centroid_y('CA')),
-                                       color='white', ha='center', va='center')
+        annotate(continental_states_ax, 'CA' + '\n' + get_value(state_df('CA'), column), xy=(centroid_x('CA') - .4,
+                                                                                             centroid_y('CA')),
+                 color='white', ha='center', va='center')
 
         # state labels for inset plots
 
         # state label annotation for Alaska inset plots
-        alaska_ax.annotate('AK' + '\n' + get_value(state_df('AK'), column), xy=(centroid_x('AK'), centroid_y('AK')),
-                           color='white', ha='center', va='center')
+        annotate(alaska_ax, 'AK' + '\n' + get_value(state_df('AK'), column), xy=(centroid_x('AK'), centroid_y('AK')),
+                 color='white', ha='center', va='center')
 
         # state label annotation for Hawaii inset plot
         # xy=(centroid_x('HI'), centroid_y('HI')
-        hawaii_ax.annotate('HI' + '\n' + get_value(state_df('HI'), column), xy=(-155.55, 19.62),
-                           color='white', ha='center', va='center')
+        annotate(hawaii_ax, 'HI' + '\n' + get_value(state_df('HI'), column), xy=(-155.55, 19.62),
+                 color='white', ha='center', va='center')
 
         # state labels for New England states
 
         # create the label for Rhode Island
-        continental_states_ax.annotate('RI' + '\n' + get_value(state_df('RI'), column), ha='center',
-                                       xy=(centroid_x('RI'), centroid_y('RI')), xycoords='data',
-                                       xytext=(-69.25, 40.25), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-32, armB=0, rad=0"))
+        annotate(continental_states_ax, 'RI' + '\n' + get_value(state_df('RI'), column), ha='center',
+                 xy=(centroid_x('RI'), centroid_y('RI')), xycoords='data',
+                 xytext=(-69.25, 40.25), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-32, armB=0, rad=0"))
 
         # create the label for Massachusetts
-        continental_states_ax.annotate('MA' + '\n' + get_value(state_df('MA'), column), ha='center',
-                                       xy=(centroid_x('MA'), centroid_y('MA')), xycoords='data',
-                                       xytext=(-69, 42.5), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=30, rad=0"))
+        annotate(continental_states_ax, 'MA' + '\n' + get_value(state_df('MA'), column), ha='center',
+                 xy=(centroid_x('MA'), centroid_y('MA')), xycoords='data',
+                 xytext=(-69, 42.5), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=30, rad=0"))
 
         # create the label for Connecticut
-        continental_states_ax.annotate('CT' + '\n' + get_value(state_df('CT'), column), ha='center',
-                                       xy=(centroid_x('CT'), centroid_y('CT')), xycoords='data',
-                                       xytext=(-70.50, 39.25), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
+        annotate(continental_states_ax, 'CT' + '\n' + get_value(state_df('CT'), column), ha='center',
+                 xy=(centroid_x('CT'), centroid_y('CT')), xycoords='data',
+                 xytext=(-70.50, 39.25), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
 
         # create the label for New Jersey
-        continental_states_ax.annotate('NJ' + '\n' + get_value(state_df('NJ'), column), ha='center',
-                                       xy=(centroid_x('NJ'), centroid_y('NJ')), xycoords='data',
-                                       xytext=(-72.75, 39.25), textcoords='data', arrowprops=dict(arrowstyle='-'))
+        annotate(continental_states_ax, 'NJ' + '\n' + get_value(state_df('NJ'), column), ha='center',
+                 xy=(centroid_x('NJ'), centroid_y('NJ')), xycoords='data',
+                 xytext=(-72.75, 39.25), textcoords='data', arrowprops=dict(arrowstyle='-'))
 
         # create the label for Delaware
-        continental_states_ax.annotate('DE' + '\n' + get_value(state_df('DE'), column), ha='center',
-                                       xy=(centroid_x('DE'), centroid_y('DE')), xycoords='data',
-                                       xytext=(-73.50, 38), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=0, armB=0, rad=0"))
+        annotate(continental_states_ax, 'DE' + '\n' + get_value(state_df('DE'), column), ha='center',
+                 xy=(centroid_x('DE'), centroid_y('DE')), xycoords='data',
+                 xytext=(-73.50, 38), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=0, armB=0, rad=0"))
 
         # create the label for DC
-        continental_states_ax.annotate('DC' + '\n' + get_value(state_df('DC'), column), ha='center',
-                                       xy=(centroid_x('DC'), centroid_y('DC')), xycoords='data',
-                                       xytext=(-74, 36), textcoords='data', arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
+        annotate(continental_states_ax, 'DC' + '\n' + get_value(state_df('DC'), column), ha='center',
+                 xy=(centroid_x('DC'), centroid_y('DC')), xycoords='data',
+                 xytext=(-74, 36), textcoords='data', arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
 
         # create the label for Maryland
-        continental_states_ax.annotate('MD' + '\n' + get_value(state_df('MD'), column), xy=(centroid_x('MD'),
-                                                                                            centroid_y('MD')),
-                                       xycoords='data', xytext=(-73, 37), textcoords='data',
-                                       arrowprops=dict(arrowstyle='-',
-                                       connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
+        annotate(continental_states_ax, 'MD' + '\n' + get_value(state_df('MD'), column), xy=(centroid_x('MD'),
+                                                                                             centroid_y('MD')),
+                 xycoords='data', xytext=(-73, 37), textcoords='data',
+                 arrowprops=dict(arrowstyle='-',
+                 connectionstyle="arc, angleA=0, angleB=0, armA=-30, armB=0, rad=0"))
 
         # state labels for extra region inset plots
         if extra_regions == True:
             # state label annotation for Puerto Rico inset plot
-            puerto_rico_ax.annotate('PR' + '\n' + get_value(state_df('PR'), column), xy=(centroid_x('PR'),
-                                                                                         centroid_y('PR')),
-                                    color='white', ha='center', va='center')
+            annotate(puerto_rico_ax, 'PR' + '\n' + get_value(state_df('PR'), column), xy=(centroid_x('PR'),
+                                                                                          centroid_y('PR')),
+                     color='white', ha='center', va='center')
 
             # state label annotation for Guam inset plot
-            guam_ax.annotate('GU' + '\n' + get_value(state_df('GU'), column), xy=(144.715, 13.355), color='white',
-                             ha='center', va='center')
+            annotate(guam_ax, 'GU' + '\n' + get_value(state_df('GU'), column), xy=(144.715, 13.355), color='white',
+                     ha='center', va='center')
 
     else:
 
@@ -455,14 +591,59 @@ def plot_states(df, column=None, extra_regions=False, labels='postal', linestyle
     # ----------------------PLOT THE FIGURE ONCE ALL THE PARAMETER VALUES ARE SPECIFIED----------------
 
     # plot the continental United States
-    df.drop(index=['AK', 'HI', 'PR']).plot(column=column, cmap=cmap, ax=continental_states_ax, edgecolor='white')
+    region_df(continental_states_ax).drop(index=['AK', 'HI', 'PR']).plot(column=column, cmap=cmap,
+                                                                         ax=continental_states_ax, edgecolor='white')
 
     # plot the inset plots
-    df.loc[['AK']].plot(column=column, cmap=cmap, ax=alaska_ax)
-    df.loc[['HI']].plot(column=column, cmap=cmap, ax=hawaii_ax)
+    region_df(alaska_ax).loc[['AK']].plot(column=column, cmap=cmap, ax=alaska_ax)
+    region_df(hawaii_ax).loc[['HI']].plot(column=column, cmap=cmap, ax=hawaii_ax)
 
     # return the plot figure
     plt.show()
     return continental_states_ax
 
 
+def _project(df, crs):
+    '''Reprojects a DataFrame, reusing the cached reprojection of the dataset it was loaded from.
+    Parameters
+    ----------
+    df : the geodataframe to reproject
+    crs : the target CRS
+
+    '''
+
+    name = df.attrs.get('dataset')
+    if name is not None:
+        source = load_dataset(name)
+        if source.crs != df.crs:
+            source = load_dataset(name, crs=df.crs)
+
+        # only reuse the cached reprojection while the geometries are still the dataset's own; attrs survive
+        # df.simplify(), clips and edits, which would otherwise plot the original boundaries. The objects are
+        # no longer the same once the dataset has been evicted and read again, so compare their coordinates then
+        original = _align(source, df)
+        if original is not None:
+            original, geometry = original.to_numpy(), df.geometry.to_numpy()
+            if all(a is b for a, b in zip(original, geometry)) or shapely.equals_exact(original, geometry, 0).all():
+                return df.set_geometry(_align(load_dataset(name, crs=crs), df))
+
+    return reproject(df, crs)
+
+
+def _align(cached, df):
+    '''Lines the geometries of a cached dataset up with the rows of a DataFrame, e.g. by 'STUSPS' for load_states.
+    Parameters
+    ----------
+    cached : the dataset as returned by load_dataset
+    df : the geodataframe to line the geometries up with
+
+    '''
+
+    if df.index.name in cached.columns:
+        geometry = cached.set_index(df.index.name).geometry
+    else:
+        geometry = cached.geometry
+
+    if not geometry.index.is_unique or not df.index.isin(geometry.index).all():
+        return None
+    return geometry.reindex(df.index)
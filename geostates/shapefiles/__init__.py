@@ -1,28 +1,48 @@
-import geopandas as gpd
-from os.path import dirname, join
+from .registry import (dataset_name, register_dataset, register_directory, list_datasets, load_dataset,
+                       reproject, crs_key, get_transformer, set_memory_limit, memory_usage, loaded_datasets,
+                       clear_cache)
 
-def load_states():
+# territories left out of the states DataFrame: American Samoa, the Virgin Islands and the Northern Mariana Islands
+EXCLUDED_TERRITORIES = ['AS', 'VI', 'MP']
+
+def load_states(vintage=2018, resolution='500k', crs=None):
     """Loads the shapefile for states in the United States.
 
+    Parameters
+    ----------
+    vintage : int, default=2018
+        The year of the Census boundary files to load.
+    resolution : str, default='500k'
+        The resolution of the Census boundary files: '500k', '5m' or '20m'.
+    crs : optional
+        Coordinate reference system to reproject the boundaries to.
+
     Returns
     --------
     data : DataFrame
         DataFrame containing the shapefile for the United States.
     """
-    module_path = dirname(__file__)
-    df = gpd.read_file(join(module_path, 'cb_2018_us_state_500k/cb_2018_us_state_500k.shp'))
-    df = df.drop([37, 38, 45])
+    df = load_dataset(dataset_name('state', vintage, resolution), crs=crs)
+    df = df[~df['STUSPS'].isin(EXCLUDED_TERRITORIES)]
     df = df.set_index('STUSPS')
     return df
 
-def load_counties():
+def load_counties(vintage=2018, resolution='500k', crs=None):
     """Loads the shapefile for counties in the United States.
 
+    Parameters
+    ----------
+    vintage : int, default=2018
+        The year of the Census boundary files to load.
+    resolution : str, default='500k'
+        The resolution of the Census boundary files: '500k', '5m' or '20m'.
+    crs : optional
+        Coordinate reference system to reproject the boundaries to.
+
     Returns
     -------
     data : DataFrame
         DataFrame containing the shapefile for the United States.
     """
-    module_path = dirname(__file__)
-    df = gpd.read_file(join(module_path, 'cb_2018_us_county_500k/cb_2018_us_county_500k.shp'))
-    return df
+    df = load_dataset(dataset_name('county', vintage, resolution), crs=crs)
+    return df.copy()
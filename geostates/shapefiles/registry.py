@@ -0,0 +1,401 @@
+import hashlib
+import importlib.util
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from os.path import abspath, dirname, expanduser, isdir, isfile, join
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+# default directory for the converted (GeoParquet) copies of the shapefiles
+CACHE_DIR = os.environ.get('GEOSTATES_CACHE_DIR', join(expanduser('~'), '.cache', 'geostates'))
+
+# default upper bound on the memory held by loaded datasets (1 GiB)
+DEFAULT_MEMORY_LIMIT = 1024 ** 3
+
+# Census cartographic boundary file names, e.g. cb_2018_us_county_500k or cb_2018_us_cd116_500k
+_CENSUS_NAME = re.compile(r'^cb_(?P<vintage>\d{4})_(?P<scope>[a-z0-9]+)_(?P<level>[a-z0-9]+)_(?P<resolution>\d+[km])$')
+
+_datasets = {}
+_loaded = OrderedDict()
+_memory_limit = DEFAULT_MEMORY_LIMIT
+
+# guards _datasets, _loaded and _memory_limit when datasets are loaded from several threads
+_lock = threading.RLock()
+
+# one lock per (name, crs) being loaded, so a slow read only blocks threads waiting for the same dataset
+_loading = {}
+
+
+def dataset_name(level, vintage=2018, resolution='500k', scope='us'):
+    '''Builds the Census file name of a boundary dataset.
+
+    Parameters
+    ----------
+    level : str
+       The summary level, e.g. 'state', 'county', 'cd116' or 'zcta510'.
+    vintage : int, default=2018
+       The year of the Census release.
+    resolution : str, default='500k'
+       The resolution of the boundaries: '500k', '5m' or '20m'.
+    scope : str, default='us'
+       The geographic scope of the file.
+
+    Returns
+    -------
+    The dataset name, e.g. 'cb_2018_us_state_500k'.
+
+    '''
+
+    return 'cb_{}_{}_{}_{}'.format(vintage, scope, level, resolution)
+
+
+def register_dataset(name, path):
+    '''Registers a boundary dataset without loading it.
+
+    Parameters
+    ----------
+    name : str
+       The name the dataset is loaded by.
+    path : str
+       A shapefile (or any file readable by geopandas), or a directory
+       containing a shapefile called ``<name>.shp``.
+
+    '''
+
+    if isdir(path):
+        path = join(path, name + '.shp')
+
+    with _lock:
+        # drop anything loaded under a previous registration of the same name
+        if _datasets.get(name) != path:
+            for key in [key for key in _loaded if key[0] == name]:
+                del _loaded[key]
+
+        _datasets[name] = path
+
+
+def register_directory(path):
+    '''Registers every shapefile found in a directory and its subdirectories.
+
+    Parameters
+    ----------
+    path : str
+       The directory to search, e.g. an unzipped set of Census
+       cartographic boundary files.
+
+    Returns
+    -------
+    The names of the registered datasets.
+
+    '''
+
+    names = []
+    for root, _, files in os.walk(path):
+        for file in sorted(files):
+            if file.endswith('.shp'):
+                name = file[:-len('.shp')]
+                register_dataset(name, join(root, file))
+                names.append(name)
+    return names
+
+
+def list_datasets(level=None, vintage=None, resolution=None):
+    '''Lists the registered datasets.
+
+    Parameters
+    ----------
+    level : str, optional
+       Only list Census datasets of this summary level.
+    vintage : int, optional
+       Only list Census datasets of this year.
+    resolution : str, optional
+       Only list Census datasets of this resolution.
+
+    Returns
+    -------
+    A sorted list of dataset names.
+
+    '''
+
+    names = []
+    for name in sorted(_datasets):
+        if level is None and vintage is None and resolution is None:
+            names.append(name)
+            continue
+
+        match = _CENSUS_NAME.match(name)
+        if match is None:
+            continue
+        if level is not None and match.group('level') != level:
+            continue
+        if vintage is not None and match.group('vintage') != str(vintage):
+            continue
+        if resolution is not None and match.group('resolution') != resolution:
+            continue
+        names.append(name)
+    return names
+
+
+def load_dataset(name, crs=None):
+    '''Loads a registered dataset.
+
+    The first load converts the shapefile to GeoParquet in ``CACHE_DIR``
+    (when pyarrow is installed) and later loads read that copy. Loaded
+    datasets are kept in memory, most recently used first, until the
+    memory limit forces them out.
+
+    Parameters
+    ----------
+    name : str
+       The name of a registered dataset.
+    crs : optional
+       Anything accepted by ``pyproj.CRS.from_user_input``. The dataset
+       is reprojected once and the result is kept alongside the
+       unprojected data.
+
+    Returns
+    -------
+    data : DataFrame
+        The cached DataFrame. Copy it before modifying it.
+
+    '''
+
+    key = (name, crs_key(crs))
+    with _lock:
+        if name not in _datasets:
+            raise KeyError('Unknown dataset \'{}\'; registered datasets are: {}'.format(name,
+                                                                                       ', '.join(list_datasets())))
+        source = _datasets[name]
+        if key in _loaded:
+            _loaded.move_to_end(key)
+            return _loaded[key][0]
+        loading = _loading.setdefault(key, threading.Lock())
+
+    # read and reproject outside of _lock so that other threads keep getting their cached datasets
+    with loading:
+        with _lock:
+            if key in _loaded:
+                _loaded.move_to_end(key)
+                return _loaded[key][0]
+
+        if crs is None:
+            df = _read(name, source)
+        else:
+            unprojected = load_dataset(name)
+
+            # the dataset is already in this CRS, so share its entry rather than holding and counting a copy
+            if crs_key(unprojected.crs) == key[1]:
+                with _lock:
+                    _loading.pop(key, None)
+                return unprojected
+            df = reproject(unprojected, crs)
+
+        df.attrs['dataset'] = name
+        size = _frame_size(df)
+
+        with _lock:
+            # a dataset re-registered while this one was read must not be cached under the new registration
+            if _datasets.get(name) == source:
+                _loaded[key] = (df, size)
+                _evict()
+            _loading.pop(key, None)
+        return df
+
+
+def reproject(df, crs):
+    '''Reprojects a DataFrame with a single vectorized transform of all of its coordinates.
+
+    Parameters
+    ----------
+    df : dataframe
+       The geodataframe to reproject.
+    crs : optional
+       The target coordinate reference system.
+
+    Returns
+    -------
+    A reprojected copy of the DataFrame.
+
+    '''
+
+    from pyproj import CRS
+
+    if df.crs is None:
+        raise ValueError('Cannot reproject a DataFrame without a CRS')
+
+    crs = CRS.from_user_input(crs)
+    if df.crs == crs:
+        return df.copy()
+
+    transformer = get_transformer(df.crs.to_wkt(), crs.to_wkt())
+    geometry = shapely.transform(df.geometry.to_numpy(), lambda coords: _transform(transformer, coords))
+    return df.set_geometry(gpd.GeoSeries(geometry, index=df.index, crs=crs, name=df.geometry.name))
+
+
+def crs_key(crs):
+    '''Normalizes a CRS so that equivalent inputs share one cache entry.
+
+    Parameters
+    ----------
+    crs : optional
+       Anything accepted by ``pyproj.CRS.from_user_input``, or None.
+
+    Returns
+    -------
+    The WKT of the CRS, or None.
+
+    '''
+
+    if crs is None:
+        return None
+    if isinstance(crs, str):
+        return _string_crs_key(crs)
+
+    from pyproj import CRS
+    return CRS.from_user_input(crs).to_wkt()
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source, target):
+    '''Returns a cached transformer between two coordinate reference systems.
+
+    Parameters
+    ----------
+    source, target : str
+       The CRS to transform from and to, e.g. as returned by ``crs_key``.
+
+    Returns
+    -------
+    A ``pyproj.Transformer`` taking x (longitude) before y (latitude).
+
+    '''
+
+    from pyproj import Transformer
+    return Transformer.from_crs(source, target, always_xy=True)
+
+
+def set_memory_limit(nbytes):
+    '''Sets the memory limit for loaded datasets, evicting the least recently used ones beyond it.
+
+    Parameters
+    ----------
+    nbytes : int or None
+       The limit in bytes, or None for no limit. The most recently
+       loaded dataset is always kept, even when it exceeds the limit.
+
+    '''
+
+    global _memory_limit
+    with _lock:
+        _memory_limit = nbytes
+        _evict()
+
+
+def memory_usage():
+    '''Returns the estimated number of bytes held by the loaded datasets.'''
+
+    with _lock:
+        return sum(size for _, size in _loaded.values())
+
+
+def loaded_datasets():
+    '''Returns the (name, crs) keys of the loaded datasets, least recently used first.'''
+
+    with _lock:
+        return list(_loaded)
+
+
+def clear_cache():
+    '''Drops every loaded dataset from memory. The files in CACHE_DIR are kept.'''
+
+    with _lock:
+        _loaded.clear()
+
+
+# -------PRIVATE METHODS-----
+
+def _read(name, source):
+    '''Reads a dataset from its GeoParquet copy, converting the source file the first time.'''
+
+    if importlib.util.find_spec('pyarrow') is None or not isfile(source):
+        return gpd.read_file(source)
+
+    cached = _cache_path(name, source)
+    if isfile(cached):
+        return gpd.read_parquet(cached)
+
+    df = gpd.read_file(source)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix='.tmp', delete=False) as file:
+            temporary = file.name
+        try:
+            df.to_parquet(temporary)
+            os.replace(temporary, cached)
+        finally:
+            if isfile(temporary):
+                os.remove(temporary)
+    except OSError:
+        # an unwritable cache directory only costs the conversion on the next load
+        pass
+    return df
+
+
+def _cache_path(name, source):
+    '''Returns the GeoParquet path for a source file, keyed by its absolute path, size and mtime.'''
+
+    # a shapefile's attributes and index live next to it, so their changes invalidate the copy too
+    stem, extension = os.path.splitext(source)
+    files = [source] + [stem + sidecar for sidecar in ('.dbf', '.shx', '.prj') if extension == '.shp']
+
+    key = []
+    for file in files:
+        if isfile(file):
+            stat = os.stat(file)
+            key.append('{}\0{}\0{}'.format(abspath(file), stat.st_size, stat.st_mtime_ns))
+    key = '\0'.join(key)
+    return join(CACHE_DIR, '{}-{}.parquet'.format(name, hashlib.sha256(key.encode()).hexdigest()[:16]))
+
+
+def _frame_size(df):
+    '''Estimates the bytes held by a DataFrame, including the coordinates of its geometries.'''
+
+    size = int(df.drop(columns=df.geometry.name).memory_usage(deep=True).sum())
+    geometry = df.geometry.to_numpy()
+    size += geometry.nbytes
+    size += int(shapely.get_num_coordinates(geometry).sum()) * 8 * (3 if shapely.has_z(geometry).any() else 2)
+    return size
+
+
+def _evict():
+    '''Evicts the least recently used datasets until the memory limit is met.'''
+
+    if _memory_limit is None:
+        return
+    while len(_loaded) > 1 and memory_usage() > _memory_limit:
+        _loaded.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def _string_crs_key(crs):
+    '''Normalizes a CRS given as a string, memoized since plots look up the same few strings on every render.'''
+
+    from pyproj import CRS
+    return CRS.from_user_input(crs).to_wkt()
+
+
+def _transform(transformer, coords):
+    '''Transforms an (N, 2) coordinate array in one call.'''
+
+    x, y = transformer.transform(coords[:, 0], coords[:, 1])
+    return np.column_stack([x, y])
+
+
+# register the boundary files shipped with the package
+register_directory(dirname(__file__))
@@ -0,0 +1,131 @@
+import os
+import threading
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from geostates.shapefiles import load_states, registry
+
+
+def write_dataset(tmp_path, name, n, **columns):
+    df = gpd.GeoDataFrame(dict({'GEOID': [str(i) for i in range(n)]}, **columns),
+                          geometry=[box(i, 0, i + 1, 1) for i in range(n)], crs='EPSG:4269')
+    path = tmp_path / (name + '.shp')
+    df.to_file(path)
+    return str(path)
+
+
+def test_dataset_name():
+    assert registry.dataset_name('state') == 'cb_2018_us_state_500k'
+    assert registry.dataset_name('cd116', 2019, '20m') == 'cb_2019_us_cd116_20m'
+
+
+def test_list_datasets(tmp_path):
+    write_dataset(tmp_path, 'cb_2020_us_zcta520_500k', 2)
+    registry.register_directory(str(tmp_path))
+    assert 'cb_2020_us_zcta520_500k' in registry.list_datasets(level='zcta520', vintage=2020)
+    assert 'cb_2020_us_zcta520_500k' not in registry.list_datasets(resolution='20m')
+
+
+def test_lru_eviction(tmp_path):
+    for name in ['cb_2018_us_a_500k', 'cb_2018_us_b_500k']:
+        registry.register_dataset(name, write_dataset(tmp_path, name, 50))
+
+    first = registry.load_dataset('cb_2018_us_a_500k')
+    assert registry.load_dataset('cb_2018_us_a_500k') is first
+
+    registry.set_memory_limit(registry.memory_usage())
+    registry.load_dataset('cb_2018_us_b_500k')
+    assert registry.loaded_datasets() == [('cb_2018_us_b_500k', None)]
+
+    registry.set_memory_limit(None)
+    projected = registry.load_dataset('cb_2018_us_a_500k', crs='EPSG:5070')
+    assert projected.crs.to_epsg() == 5070
+    assert registry.load_dataset('cb_2018_us_a_500k', crs='EPSG:5070') is projected
+
+
+def test_register_dataset_with_new_path(tmp_path):
+    (tmp_path / 'old').mkdir()
+    (tmp_path / 'new').mkdir()
+    name = 'cb_2018_us_d_500k'
+    registry.register_dataset(name, write_dataset(tmp_path / 'old', name, 2))
+    assert len(registry.load_dataset(name)) == 2
+
+    registry.register_dataset(name, write_dataset(tmp_path / 'new', name, 3))
+    assert registry.loaded_datasets() == []
+    assert len(registry.load_dataset(name)) == 3
+
+
+def test_geoparquet_cache(tmp_path):
+    pytest.importorskip('pyarrow')
+    name = 'cb_2018_us_e_500k'
+    path = write_dataset(tmp_path, name, 2)
+    registry.register_dataset(name, path)
+
+    first = registry.load_dataset(name)
+    cached = [file for file in os.listdir(registry.CACHE_DIR) if file.endswith('.parquet')]
+    assert len(cached) == 1
+
+    # a second process would read the converted copy
+    registry.clear_cache()
+    assert registry.load_dataset(name).geometry.geom_equals(first.geometry).all()
+
+    # rewriting the source gives it a new cache key, so the old copy is not read
+    write_dataset(tmp_path, name, 4)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10 ** 9))
+    registry.clear_cache()
+    assert len(registry.load_dataset(name)) == 4
+
+
+def test_load_states_excludes_territories(tmp_path):
+    postal = ['AL', 'AS', 'VI', 'GU', 'MP', 'PR']
+    registry.register_dataset('cb_2099_us_state_500k',
+                              write_dataset(tmp_path, 'cb_2099_us_state_500k', len(postal), STUSPS=postal))
+
+    df = load_states(vintage=2099)
+    assert list(df.index) == ['AL', 'GU', 'PR']
+    assert df.attrs['dataset'] == 'cb_2099_us_state_500k'
+
+
+def test_reproject_matches_to_crs(tmp_path):
+    df = gpd.read_file(write_dataset(tmp_path, 'cb_2018_us_c_500k', 3))
+    projected = registry.reproject(df, 'EPSG:5070')
+    expected = df.to_crs('EPSG:5070')
+    assert projected.crs == expected.crs
+    assert projected.geometry.geom_equals_exact(expected.geometry, tolerance=1e-6).all()
+
+
+def test_load_dataset_in_its_own_crs(tmp_path):
+    name = 'cb_2018_us_f_500k'
+    registry.register_dataset(name, write_dataset(tmp_path, name, 2))
+
+    df = registry.load_dataset(name)
+    assert registry.load_dataset(name, crs='EPSG:4269') is df
+    assert registry.loaded_datasets() == [(name, None)]
+
+
+def test_slow_load_does_not_block_cached_datasets(tmp_path, monkeypatch):
+    for name in ['cb_2018_us_g_500k', 'cb_2018_us_h_500k']:
+        registry.register_dataset(name, write_dataset(tmp_path, name, 2))
+    cached = registry.load_dataset('cb_2018_us_g_500k')
+
+    reading = threading.Event()
+    release = threading.Event()
+    read = registry._read
+
+    def slow_read(name, source):
+        reading.set()
+        release.wait(10)
+        return read(name, source)
+
+    monkeypatch.setattr(registry, '_read', slow_read)
+    thread = threading.Thread(target=registry.load_dataset, args=('cb_2018_us_h_500k',))
+    thread.start()
+    try:
+        assert reading.wait(10)
+        assert registry.load_dataset('cb_2018_us_g_500k') is cached
+    finally:
+        release.set()
+        thread.join()
+    assert ('cb_2018_us_h_500k', None) in registry.loaded_datasets()
@@ -1,7 +1,6 @@
-import geopandas as gpd
-from os.path import dirname, join
+from .shapefiles import load_dataset, dataset_name
 
-def get_state(state):
+def get_state(state, vintage=2018, resolution='500k'):
     '''Extract an individual state from the DataFrame.
 
     Parameters
@@ -10,16 +9,21 @@ def get_state(state):
     state : str
        The state to extract from the DataFrame.
 
+    vintage : int, default=2018
+       The year of the Census county boundary files to use.
+
+    resolution : str, default='500k'
+       The resolution of the Census county boundary files: '500k', '5m' or '20m'.
+
     Returns
     -------
     df for a particular state.
 
     '''
 
-    # load in the counties shape file
+    # load in the counties shape file (cached after the first call)
 
-    module_path = dirname(__file__)
-    df = gpd.read_file(join(module_path, 'shapefiles/cb_2018_us_county_500k/cb_2018_us_county_500k.shp'))
+    df = load_dataset(dataset_name('county', vintage, resolution))
 
     # create a dictionary to map the 'STATEFP' values to each state
     state_dic = {'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09', 'DE': '10',
@@ -0,0 +1,117 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import geopandas as gpd
+import matplotlib.pyplot as plt
+import pytest
+from shapely.geometry import box
+
+from geostates import plot
+from geostates.shapefiles import load_states, registry
+
+# rough centres of the states the plot labels by name
+CENTRES = {'AK': (-152, 64), 'HI': (-155.5, 19.6), 'PR': (-66.4, 18.2), 'GU': (144.8, 13.45), 'RI': (-71.5, 41.7),
+           'DC': (-77, 38.9), 'DE': (-75.5, 39), 'FL': (-82, 28), 'MI': (-85, 44), 'LA': (-92, 31),
+           'CA': (-120, 37), 'MD': (-76.7, 39.2), 'NJ': (-74.5, 40), 'MA': (-71.8, 42.3), 'CT': (-72.7, 41.6),
+           'TX': (-99, 31)}
+
+
+@pytest.fixture
+def states(tmp_path):
+    postal = list(CENTRES)
+    df = gpd.GeoDataFrame({'STUSPS': postal},
+                          geometry=[box(x - .2, y - .2, x + .2, y + .2) for x, y in CENTRES.values()],
+                          crs='EPSG:4269')
+    df.to_file(tmp_path / 'cb_2099_us_state_500k.shp')
+    registry.register_dataset('cb_2099_us_state_500k', str(tmp_path / 'cb_2099_us_state_500k.shp'))
+
+    df = load_states(vintage=2099)
+    df['value'] = range(len(df))
+    yield df
+    plt.close('all')
+
+
+def test_plot_states_albers(states):
+    ax = plot.plot_states(states, 'value', projection='albers')
+
+    # the continental limits are in metres, not degrees
+    xmin, xmax = ax.get_xlim()
+    assert xmax - xmin > 1e6
+
+
+def test_plot_states_projected_input(states):
+    expected = plot.plot_states(states, 'value', projection='albers').get_xlim()
+    projected = load_states(vintage=2099, crs='EPSG:5070')
+    projected['value'] = states['value']
+    assert plot.plot_states(projected, 'value', projection='albers').get_xlim() == pytest.approx(expected)
+    assert plot.plot_states(projected, 'value').get_xlim() == pytest.approx((-130, -64))
+
+
+def test_second_render_reuses_cache(states, monkeypatch):
+    plot.plot_states(states, 'value', projection='albers', extra_regions=True)
+    loaded = registry.loaded_datasets()
+    assert ('cb_2099_us_state_500k', registry.crs_key('EPSG:5070')) in loaded
+
+    def fail(df, crs):
+        raise AssertionError('reprojected on the second render')
+
+    monkeypatch.setattr(registry, 'reproject', fail)
+    monkeypatch.setattr(plot, 'reproject', fail)
+    plot.plot_states(states, 'value', projection='albers', extra_regions=True)
+    assert set(registry.loaded_datasets()) == set(loaded)
+
+
+def test_render_after_eviction_reuses_cache(states, monkeypatch):
+    plot.plot_states(states, 'value', projection='albers', extra_regions=True)
+    registry.clear_cache()
+
+    def fail(df, crs):
+        raise AssertionError('reprojected without the cache')
+
+    # the dataset is read again and reprojected once into the cache ...
+    monkeypatch.setattr(plot, 'reproject', fail)
+    plot.plot_states(states, 'value', projection='albers', extra_regions=True)
+
+    # ... and the next render reuses it
+    monkeypatch.setattr(registry, 'reproject', fail)
+    plot.plot_states(states, 'value', projection='albers', extra_regions=True)
+
+
+def test_geographic_frame_is_plotted_as_is(states, monkeypatch):
+    states = gpd.GeoDataFrame(states.drop(columns='geometry'), geometry=list(states.geometry), crs='EPSG:4326')
+
+    def fail(df, crs):
+        raise AssertionError('reprojected without a projection')
+
+    monkeypatch.setattr(plot, 'reproject', fail)
+    monkeypatch.setattr(registry, 'reproject', fail)
+    assert plot.plot_states(states, 'value').get_xlim() == pytest.approx((-130, -64))
+
+
+def test_modified_geometry_is_reprojected(states, monkeypatch):
+    states = states.set_geometry(states.scale(.5, .5))
+    projected = []
+
+    def project(df, crs):
+        projected.append(plot_project(df, crs))
+        return projected[-1]
+
+    plot_project = plot._project
+    monkeypatch.setattr(plot, '_project', project)
+    plot.plot_states(states, 'value', projection='albers')
+
+    expected = states.to_crs('EPSG:5070')
+    conus = [df for df in projected if df.crs == expected.crs][0]
+    assert conus.geometry.geom_equals_exact(expected.geometry, tolerance=1e-3).all()
+
+
+def test_unknown_projection(states):
+    with pytest.raises(ValueError):
+        plot.plot_states(states, 'value', projection='mercator')
+
+
+def test_missing_crs(states):
+    with pytest.raises(ValueError):
+        plot.plot_states(gpd.GeoDataFrame(states.drop(columns='geometry'), geometry=list(states.geometry)),
+                         'value', projection='albers')